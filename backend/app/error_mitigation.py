@@ -31,11 +31,13 @@ def build_readout_calibration_matrix(
     if not measured_states:
         measured_states = prepared_states.copy()
 
-    matrix = np.zeros((len(measured_states), len(prepared_states)), dtype=float)
-    for col, prepared in enumerate(prepared_states):
-        normalized = _normalize_counts(calibration_counts.get(prepared, {}))
-        for row, measured in enumerate(measured_states):
-            matrix[row, col] = normalized.get(measured, 0.0)
+    columns = [calibration_counts.get(prepared, {}) for prepared in prepared_states]
+    counts = np.array(
+        [[column.get(measured, 0) for column in columns] for measured in measured_states],
+        dtype=float,
+    ).reshape(len(measured_states), len(prepared_states))
+    totals = np.array([sum(column.values()) for column in columns], dtype=float)
+    matrix = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
 
     return matrix, prepared_states
 
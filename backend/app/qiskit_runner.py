@@ -1,11 +1,34 @@
+import functools
 import os
 from typing import Dict, Optional, List, Any, Tuple
 
+import numpy as np
 from dotenv import load_dotenv
 
 from .cosmic_metrics import calculate_cosmic_metrics
 from .hardware_metrics import calculate_hardware_metrics
 
+_SQRT1_2 = 1 / np.sqrt(2)
+
+
+def _readonly_unitary(rows: List[List[complex]]) -> np.ndarray:
+    matrix = np.array(rows, dtype=complex)
+    matrix.setflags(write=False)
+    return matrix
+
+
+# Unitaries of the fixed single-qubit gates, applied directly to branch
+# statevectors instead of building a throwaway QuantumCircuit per gate.
+_GATE_LUT: Dict[str, np.ndarray] = {
+    "h": _readonly_unitary([[_SQRT1_2, _SQRT1_2], [_SQRT1_2, -_SQRT1_2]]),
+    "x": _readonly_unitary([[0, 1], [1, 0]]),
+    "y": _readonly_unitary([[0, -1j], [1j, 0]]),
+    "z": _readonly_unitary([[1, 0], [0, -1]]),
+    "s": _readonly_unitary([[1, 0], [0, 1j]]),
+    "t": _readonly_unitary([[1, 0], [0, np.exp(1j * np.pi / 4)]]),
+}
+
+
 def _get_angle(value: Any) -> float:
     try:
         angle = float(value)
@@ -117,6 +140,18 @@ def _confidence_intervals(counts: Dict[str, int], shots: int, z_value: float = 1
     return intervals
 
 
+def _single_condition_bit(bits: Any, num_clbits: int) -> Optional[int]:
+    """Return the classical bit of a single-bit condition, validating its range."""
+    if isinstance(bits, int):
+        bits = [bits]
+    if not isinstance(bits, list) or len(bits) != 1:
+        return None
+    bit = int(bits[0])
+    if bit < 0 or bit >= num_clbits:
+        raise ValueError("Conditional gate bit index out of range")
+    return bit
+
+
 def _apply_condition(instruction, qc, gate: Dict[str, Any]) -> None:
     params = gate.get("params") or {}
     condition = None
@@ -147,12 +182,8 @@ def _apply_condition(instruction, qc, gate: Dict[str, Any]) -> None:
         instruction.c_if(qc.cregs[0], value)
         return
 
-    if isinstance(bits, int):
-        bits = [bits]
-    if isinstance(bits, list) and len(bits) == 1:
-        bit = int(bits[0])
-        if bit < 0 or bit >= qc.num_clbits:
-            raise ValueError("Conditional gate bit index out of range")
+    bit = _single_condition_bit(bits, qc.num_clbits)
+    if bit is not None:
         instruction.c_if(qc.clbits[bit], value)
         return
 
@@ -225,6 +256,11 @@ def _condition_is_met(condition: Any, classical_bits: List[int]) -> bool:
 
 
 def _apply_gate_unitary(statevector, gate: Dict[str, Any], num_qubits: int):
+    matrix = _GATE_LUT.get(gate.get("type"))
+    qubit = gate.get("qubit")
+    if matrix is not None and qubit is not None:
+        return statevector.evolve(matrix, qargs=[int(qubit)])
+
     try:
         from qiskit import QuantumCircuit
     except Exception as e:  # pragma: no cover
@@ -294,15 +330,23 @@ def _measurement_target_and_cbit(gate: Dict[str, Any], num_clbits: int) -> Tuple
     return int(target), int(cbit)
 
 
-def _apply_reset_statevector(statevector, target: int, num_qubits: int):
-    try:
-        from qiskit import QuantumCircuit
-    except Exception as e:  # pragma: no cover
-        raise RuntimeError(f"Failed to import Qiskit: {e}")
+def _validate_gates(gates: List[Dict[str, Any]], num_clbits: int, check_classical_bits: bool) -> None:
+    # Fail fast on malformed input before any circuit or simulator is built.
+    for gate in gates:
+        gtype = gate.get("type")
+        if gtype not in _SUPPORTED_GATES:
+            raise ValueError(f"Unsupported gate type: {gtype}")
+        if not check_classical_bits:
+            continue
+        if gtype == "measure":
+            _measurement_target_and_cbit(gate, num_clbits)
+        condition = _condition_from_params(gate.get("params"))
+        if isinstance(condition, dict) and condition.get("value") is not None:
+            _single_condition_bit(condition.get("bits"), num_clbits)
 
-    qc_tmp = QuantumCircuit(num_qubits)
-    qc_tmp.x(target)
-    return statevector.evolve(qc_tmp)
+
+def _apply_reset_statevector(statevector, target: int):
+    return statevector.evolve(_GATE_LUT["x"], qargs=[target])
 
 
 def _probabilities_to_counts(probabilities: Dict[str, float], shots: int) -> Dict[str, int]:
@@ -347,6 +391,23 @@ def _default_noise_model():
     return noise_model
 
 
+@functools.lru_cache(maxsize=1)
+def _get_noisy_backend():
+    from qiskit_aer import AerSimulator
+
+    return AerSimulator(noise_model=_default_noise_model())
+
+
+# Gate types handled by _apply_gate below. Keep this in sync with its branches;
+# test_supported_gates_are_handled_by_apply_gate checks that every entry is.
+_SUPPORTED_GATES = frozenset(
+    {
+        "h", "x", "y", "z", "s", "t", "rx", "ry", "rz", "p", "cp",
+        "cnot", "cx", "cz", "swap", "toffoli", "ccx", "measure",
+    }
+)
+
+
 def _apply_gate(qc, gate: Dict[str, Any]):
     gtype = gate.get("type")
     qubit = gate.get("qubit")
@@ -467,7 +528,49 @@ def _apply_gate(qc, gate: Dict[str, Any]):
         raise ValueError(f"Unsupported gate type: {gtype}")
 
 
+def _import_aer():
+    try:
+        from qiskit_aer import Aer
+    except Exception:
+        try:
+            from qiskit import Aer  # older import path
+        except Exception as e:  # pragma: no cover
+            raise RuntimeError(f"Qiskit Aer not available: {e}")
+    return Aer
+
+
+# Backends provided by qiskit_aer.Aer. Kept static so resolving a name never has
+# to list (and so instantiate) every legacy simulator.
+_AER_BACKEND_NAMES = frozenset(
+    {
+        "aer_simulator",
+        "aer_simulator_density_matrix",
+        "aer_simulator_extended_stabilizer",
+        "aer_simulator_matrix_product_state",
+        "aer_simulator_stabilizer",
+        "aer_simulator_statevector",
+        "aer_simulator_superop",
+        "aer_simulator_unitary",
+        "qasm_simulator",
+        "statevector_simulator",
+        "unitary_simulator",
+    }
+)
+
+
 def _get_aer_backend(backend_name: str):
+    # backend_name can come from API clients; unknown names resolve to the
+    # legacy qasm_simulator before caching so the cache stays bounded by the
+    # set of Aer backends.
+    if backend_name not in _AER_BACKEND_NAMES:
+        backend_name = "qasm_simulator"
+    return _load_aer_backend(backend_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_aer_backend(backend_name: str):
+    # Backends hold no per-run state (shots/memory are passed to run()), so one
+    # instance per name is shared across calls.
     # Prefer modern AerSimulator
     try:
         from qiskit_aer import AerSimulator
@@ -477,14 +580,7 @@ def _get_aer_backend(backend_name: str):
         pass
 
     # Fallback to Aer.get_backend
-    try:
-        from qiskit_aer import Aer
-    except Exception:
-        try:
-            from qiskit import Aer  # older import path
-        except Exception as e:  # pragma: no cover
-            raise RuntimeError(f"Qiskit Aer not available: {e}")
-
+    Aer = _import_aer()
     try:
         return Aer.get_backend(backend_name)
     except Exception:
@@ -561,6 +657,10 @@ def run_circuit(
 
         gates_sorted = gates_filtered + measurement_gates
 
+    # Classical-bit indices are only enforced up front for shot-based runs,
+    # where building the circuit would reject them anyway.
+    _validate_gates(gates_sorted, num_qubits, check_classical_bits=method_norm != "statevector")
+
     if method_norm == "statevector":
         max_qubits = int(os.getenv("STATEVECTOR_MAX_QUBITS", "10"))
         if num_qubits > max_qubits:
@@ -656,7 +756,7 @@ def run_circuit(
                                 continue
                             collapsed = _collapse_statevector(rotated, target, outcome)
                             if reset_after and outcome == 1:
-                                collapsed = _apply_reset_statevector(collapsed, target, num_qubits)
+                                collapsed = _apply_reset_statevector(collapsed, target)
                             new_classical = list(classical)
                             new_classical[cbit] = outcome
                             next_branches.append((weight * prob, collapsed, new_classical))
@@ -747,10 +847,7 @@ def run_circuit(
 
     # Execute
     if method_norm == "noisy":
-        from qiskit_aer import AerSimulator
-
-        noise_model = _default_noise_model()
-        backend = AerSimulator(noise_model=noise_model)
+        backend = _get_noisy_backend()
         backend_used = "aer_simulator_noisy"
         tcirc = transpile(qc, backend)
         run_kwargs = {"shots": int(shots), "memory": bool(memory)}
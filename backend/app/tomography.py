@@ -1,20 +1,50 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 
+try:
+    from scipy.linalg import eigh as _scipy_eigh
+except ImportError:  # pragma: no cover - SciPy ships with Qiskit
+    _scipy_eigh = None
 
-def _normalize_counts(counts: Dict[str, int]) -> Dict[str, float]:
+
+def _readonly_vector(*values: float) -> np.ndarray:
+    vector = np.array(values, dtype=float)
+    vector.setflags(write=False)
+    return vector
+
+
+# Bloch vectors of the supported process-tomography input states, shared
+# across calls (read-only so callers cannot mutate them).
+_INPUT_BLOCH: Dict[str, np.ndarray] = {
+    "0": _readonly_vector(0.0, 0.0, 1.0),
+    "1": _readonly_vector(0.0, 0.0, -1.0),
+    "+": _readonly_vector(1.0, 0.0, 0.0),
+    "-": _readonly_vector(-1.0, 0.0, 0.0),
+    "+i": _readonly_vector(0.0, 1.0, 0.0),
+    "-i": _readonly_vector(0.0, -1.0, 0.0),
+}
+
+
+def _expectation_from_counts(counts: Dict[str, int]) -> float:
+    # Only the "0" and "1" entries contribute, so skip the full normalization.
     total = float(sum(counts.values()))
     if total <= 0:
-        return {state: 0.0 for state in counts}
-    return {state: value / total for state, value in counts.items()}
+        return 0.0
+    return float((counts.get("0", 0) - counts.get("1", 0)) / total)
 
 
-def _expectation_from_counts(counts: Dict[str, int]) -> float:
-    probabilities = _normalize_counts(counts)
-    return float(probabilities.get("0", 0.0) - probabilities.get("1", 0.0))
+def _bloch_vector(measurements: Dict[str, Dict[str, int]]) -> Tuple[float, float, float]:
+    for basis in ("x", "y", "z"):
+        if basis not in measurements:
+            raise ValueError(f"Missing {basis}-basis measurements.")
+    return (
+        _expectation_from_counts(measurements["x"]),
+        _expectation_from_counts(measurements["y"]),
+        _expectation_from_counts(measurements["z"]),
+    )
 
 
 def state_tomography_single_qubit(
@@ -29,21 +59,14 @@ def state_tomography_single_qubit(
     Returns:
         Dictionary containing density_matrix and Bloch vector.
     """
-    for basis in ("x", "y", "z"):
-        if basis not in measurements:
-            raise ValueError(f"Missing {basis}-basis measurements.")
-
-    rx = _expectation_from_counts(measurements["x"])
-    ry = _expectation_from_counts(measurements["y"])
-    rz = _expectation_from_counts(measurements["z"])
+    rx, ry, rz = _bloch_vector(measurements)
 
-    rho = np.array(
-        [
-            [(1 + rz) / 2, (rx - 1j * ry) / 2],
-            [(rx + 1j * ry) / 2, (1 - rz) / 2],
-        ],
-        dtype=complex,
-    )
+    rho = np.empty((2, 2), dtype=complex)
+    rho[0, 0] = (1 + rz) / 2
+    rho[1, 1] = (1 - rz) / 2
+    # 0.0 - y rather than -y so an unpolarized y axis serializes as 0.0, not -0.0.
+    rho[0, 1] = complex(rx / 2, 0.0 - ry / 2)
+    rho[1, 0] = complex(rx / 2, ry / 2)
 
     return {
         "density_matrix": _matrix_to_json(rho),
@@ -68,11 +91,18 @@ def measurement_tomography_single_qubit(
         if state not in calibration_counts:
             raise ValueError(f"Missing calibration data for |{state}>.")
 
-    matrix = np.zeros((2, 2), dtype=float)
-    for col, prepared in enumerate(prepared_states):
-        probs = _normalize_counts(calibration_counts[prepared])
-        matrix[0, col] = probs.get("0", 0.0)
-        matrix[1, col] = probs.get("1", 0.0)
+    counts = np.array(
+        [
+            [calibration_counts[prepared].get(measured, 0) for prepared in prepared_states]
+            for measured in ("0", "1")
+        ],
+        dtype=float,
+    )
+    totals = np.array(
+        [sum(calibration_counts[prepared].values()) for prepared in prepared_states],
+        dtype=float,
+    )
+    matrix = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
 
     fidelity = float((matrix[0, 0] + matrix[1, 1]) / 2.0)
     return {
@@ -94,39 +124,34 @@ def process_tomography_single_qubit(
     Returns:
         Pauli transfer matrix (3x3) and output Bloch vectors.
     """
-    input_bloch = {
-        "0": np.array([0.0, 0.0, 1.0]),
-        "1": np.array([0.0, 0.0, -1.0]),
-        "+": np.array([1.0, 0.0, 0.0]),
-        "-": np.array([-1.0, 0.0, 0.0]),
-        "+i": np.array([0.0, 1.0, 0.0]),
-        "-i": np.array([0.0, -1.0, 0.0]),
-    }
+    labels = list(process_measurements.keys())
+
+    # Only the Bloch vectors are needed here, so skip building per-input
+    # density matrices and fill preallocated (N, 3) arrays row by row.
+    input_matrix = np.empty((len(labels), 3), dtype=float)
+    output_matrix = np.empty_like(input_matrix)
+    for row, label in enumerate(labels):
+        if label not in _INPUT_BLOCH:
+            raise ValueError(f"Unsupported input state label: {label}")
+        input_matrix[row] = _INPUT_BLOCH[label]
+        output_matrix[row] = _bloch_vector(process_measurements[label])
 
-    inputs: List[np.ndarray] = []
-    outputs: List[np.ndarray] = []
-    output_vectors: Dict[str, Dict[str, float]] = {}
+    output_vectors: Dict[str, Dict[str, float]] = {
+        label: {"x": x, "y": y, "z": z}
+        for label, (x, y, z) in zip(labels, output_matrix.tolist())
+    }
 
-    for label, measurements in process_measurements.items():
-        if label not in input_bloch:
-            raise ValueError(f"Unsupported input state label: {label}")
-        tomography = state_tomography_single_qubit(measurements)
-        bloch = tomography["bloch_vector"]
-        out_vec = np.array([bloch["x"], bloch["y"], bloch["z"]], dtype=float)
-        inputs.append(input_bloch[label])
-        outputs.append(out_vec)
-        output_vectors[label] = {
-            "x": float(out_vec[0]),
-            "y": float(out_vec[1]),
-            "z": float(out_vec[2]),
-        }
-
-    if len(inputs) < 3:
+    if len(labels) < 3:
         raise ValueError("At least three input states are required for process tomography.")
 
-    input_matrix = np.stack(inputs, axis=0)
-    output_matrix = np.stack(outputs, axis=0)
-    transfer, *_ = np.linalg.lstsq(input_matrix, output_matrix, rcond=None)
+    # Every supported input is a +/- Pauli axis, so input_matrix.T @ input_matrix
+    # is diagonal (the per-axis input count). When all three axes are covered the
+    # least-squares solution is just the sign-weighted mean of the outputs.
+    axis_counts = np.abs(input_matrix).sum(axis=0)
+    if np.all(axis_counts > 0):
+        transfer = (input_matrix.T @ output_matrix) / axis_counts[:, None]
+    else:
+        transfer, *_ = np.linalg.lstsq(input_matrix, output_matrix, rcond=None)
 
     return {
         "pauli_transfer_matrix": transfer.tolist(),
@@ -135,31 +160,136 @@ def process_tomography_single_qubit(
 
 
 def state_fidelity(
-    rho: List[List[complex]],
-    sigma: List[List[complex]],
+    rho: Union[np.ndarray, List[List[complex]]],
+    sigma: Union[np.ndarray, List[List[complex]]],
 ) -> float:
     """
     Compute Uhlmann fidelity between two density matrices.
+
+    Only the trace of sqrt(sqrt(rho) sigma sqrt(rho)) is needed, so the outer
+    square root is replaced by the sum of square-rooted eigenvalues. When either
+    state is pure the fidelity reduces to Tr(rho sigma) and no decomposition is
+    performed.
+    """
+    # No copy is made when the caller already holds contiguous complex arrays.
+    rho_mat = np.ascontiguousarray(rho, dtype=complex)
+    sigma_mat = np.ascontiguousarray(sigma, dtype=complex)
+    return _state_fidelity_arr(rho_mat, sigma_mat)
+
+
+def state_fidelity_batch(
+    rhos: Union[np.ndarray, List[List[List[complex]]]],
+    sigmas: Union[np.ndarray, List[List[List[complex]]], List[List[complex]]],
+) -> List[float]:
     """
-    rho_mat = np.array(rho, dtype=complex)
-    sigma_mat = np.array(sigma, dtype=complex)
+    Compute Uhlmann fidelities for a stack of density-matrix pairs at once.
+
+    Args:
+        rhos: Density matrices with shape (B, n, n).
+        sigmas: Density matrices with shape (B, n, n), or a single (n, n)
+            reference state compared against every entry of rhos.
+
+    Returns:
+        List of B fidelities.
+    """
+    rho_mats = np.array(rhos, dtype=complex)
+    sigma_mats = np.ascontiguousarray(sigmas, dtype=complex)
+    if rho_mats.ndim != 3 or rho_mats.shape[-1] != rho_mats.shape[-2]:
+        raise ValueError("rhos must have shape (B, n, n).")
+    if sigma_mats.shape[-2:] != rho_mats.shape[-2:]:
+        raise ValueError("sigmas must match the matrix shape of rhos.")
+
+    values, vectors = np.linalg.eigh(_hermitize_inplace(rho_mats))
+    sqrt_values = np.sqrt(np.clip(values, 0.0, None))
+    sqrt_rhos = (vectors * sqrt_values[..., None, :]) @ np.swapaxes(vectors.conj(), -1, -2)
+    inner = _hermitize_inplace(sqrt_rhos @ sigma_mats @ sqrt_rhos)
+    eigenvalues = np.clip(np.linalg.eigvalsh(inner), 0.0, None)
+    fidelities = np.sum(np.sqrt(eigenvalues), axis=-1) ** 2
+    return np.minimum(fidelities, 1.0).tolist()
+
+
+def _state_fidelity_arr(rho_mat: np.ndarray, sigma_mat: np.ndarray) -> float:
+    if _is_pure(rho_mat) or _is_pure(sigma_mat):
+        overlap = float(np.einsum("ij,ji->", rho_mat, sigma_mat).real)
+        return max(0.0, min(1.0, overlap))
 
     sqrt_rho = _matrix_sqrt(rho_mat)
-    inner = sqrt_rho @ sigma_mat @ sqrt_rho
-    sqrt_inner = _matrix_sqrt(inner)
-    fidelity = float(np.real(np.trace(sqrt_inner)) ** 2)
-    return max(0.0, min(1.0, fidelity))
+    inner = _hermitize_inplace(sqrt_rho @ sigma_mat @ sqrt_rho)
+    # The square-rooted trace is non-negative by construction; only cap at 1.
+    fidelity = _matrix_sqrt_trace(inner) ** 2
+    return min(1.0, fidelity)
+
+
+def _is_pure(matrix: np.ndarray, tol: float = 1e-9) -> bool:
+    trace = float(np.trace(matrix).real)
+    purity = float(np.vdot(matrix, matrix).real)
+    return abs(trace - 1.0) <= tol and abs(purity - 1.0) <= tol
+
+
+def _hermitize_inplace(matrix: np.ndarray) -> np.ndarray:
+    # conj() returns a new array, so the in-place add never reads its own output.
+    # Swapping the last two axes also handles stacked (..., n, n) inputs.
+    matrix += np.swapaxes(matrix.conj(), -1, -2)
+    matrix *= 0.5
+    return matrix
 
 
 def _matrix_sqrt(matrix: np.ndarray) -> np.ndarray:
-    values, vectors = np.linalg.eigh(matrix)
+    matrix = _hermitize_inplace(np.array(matrix, dtype=complex))
+    if matrix.shape == (2, 2):
+        trace, det = _trace_det_2x2(matrix)
+        # The closed form only holds for PSD input; non-physical tomography
+        # estimates fall through to the clipped eigendecomposition below.
+        if det >= 0.0 and trace >= 0.0:
+            return _matrix_sqrt_2x2(matrix, trace, det)
+    values, vectors = _eigh(matrix)
     values = np.clip(values, 0.0, None)
     sqrt_values = np.sqrt(values)
-    return vectors @ np.diag(sqrt_values) @ vectors.conj().T
+    # Scale eigenvector columns directly instead of multiplying by np.diag(...).
+    return (vectors * sqrt_values) @ vectors.conj().T
+
+
+def _matrix_sqrt_trace(matrix: np.ndarray) -> float:
+    # Expects a Hermitian matrix.
+    if matrix.shape == (2, 2):
+        trace, det = _trace_det_2x2(matrix)
+        # tr(sqrt(M)) = sqrt(tr(M) + 2 sqrt(det(M))) for a 2x2 PSD matrix; a
+        # non-physical sigma makes M indefinite, so clip eigenvalues instead.
+        if det >= 0.0 and trace >= 0.0:
+            return float(np.sqrt(trace + 2.0 * np.sqrt(det)))
+    eigenvalues = np.linalg.eigvalsh(matrix)
+    return float(np.sum(np.sqrt(np.clip(eigenvalues, 0.0, None))))
+
+
+def _eigh(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # LAPACK's divide-and-conquer driver is faster than NumPy's default for the
+    # small Hermitian matrices handled here.
+    if _scipy_eigh is not None:
+        return _scipy_eigh(matrix, driver="evd", check_finite=False)
+    return np.linalg.eigh(matrix)
+
+
+def _trace_det_2x2(matrix: np.ndarray) -> Tuple[float, float]:
+    trace = float((matrix[0, 0] + matrix[1, 1]).real)
+    det = float((matrix[0, 0] * matrix[1, 1] - matrix[0, 1] * matrix[1, 0]).real)
+    return trace, det
+
+
+def _matrix_sqrt_2x2(matrix: np.ndarray, trace: float, det: float) -> np.ndarray:
+    # Closed form for a 2x2 PSD matrix: sqrt(M) = (M + s*I) / sqrt(tr(M) + 2s),
+    # with s = sqrt(det(M)).
+    s = np.sqrt(det)
+    t = trace + 2.0 * s
+    if t <= 0:
+        return np.zeros_like(matrix)
+    result = matrix.copy()
+    result[0, 0] += s
+    result[1, 1] += s
+    return result / np.sqrt(t)
 
 
 def _matrix_to_json(matrix: np.ndarray) -> List[List[List[float]]]:
-    return [
-        [[float(value.real), float(value.imag)] for value in row] for row in matrix
-    ]
+    # Reinterpret complex entries as interleaved (real, imag) float pairs.
+    matrix = np.ascontiguousarray(matrix, dtype=complex)
+    return matrix.view(float).reshape(*matrix.shape, 2).tolist()
 
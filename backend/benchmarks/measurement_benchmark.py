@@ -9,29 +9,30 @@ if str(ROOT) not in sys.path:
 from app.qiskit_runner import run_circuit
 
 
+# Shared by every rotation gate; run_circuit never mutates gate params.
+_GATE_PARAMS = {"phi": 0.1}
+_CNOT_TEMPLATE = {"type": "cnot", "qubit": 0, "targets": [1]}
+
+
 def build_benchmark_gates(num_qubits: int, depth: int) -> list[dict]:
     gates = []
     position = 0
     for layer in range(depth):
+        gate_type = "h" if layer % 2 == 0 else "rz"
         for qubit in range(num_qubits):
             gates.append(
                 {
-                    "type": "h" if layer % 2 == 0 else "rz",
+                    "type": gate_type,
                     "qubit": qubit,
                     "position": position,
-                    "params": {"phi": 0.1},
+                    "params": _GATE_PARAMS,
                 }
             )
             position += 1
         if num_qubits > 1:
-            gates.append(
-                {
-                    "type": "cnot",
-                    "qubit": 0,
-                    "targets": [1],
-                    "position": position,
-                }
-            )
+            gate = _CNOT_TEMPLATE.copy()
+            gate["position"] = position
+            gates.append(gate)
             position += 1
     return gates
 
@@ -0,0 +1,8 @@
+import pathlib
+import sys
+
+# Single bootstrap for every test module: makes the backend `app` package
+# importable under pytest, unittest discovery and direct script runs.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,16 @@
+from typing import Dict
+
+import numpy as np
+
+
+class ProbAssertMixin:
+    def assertProbs(self, probs: Dict[str, float], expected: Dict[str, float], atol: float = 5e-9):
+        """Compare selected outcome probabilities in one vectorized check.
+
+        Missing outcomes count as 0.0. The default tolerance matches
+        assertAlmostEqual(..., places=8).
+        """
+        keys = list(expected.keys())
+        actual = np.array([probs.get(key, 0.0) for key in keys], dtype=float)
+        target = np.array([expected[key] for key in keys], dtype=float)
+        np.testing.assert_allclose(actual, target, rtol=0.0, atol=atol, err_msg=f"outcomes {keys}")
@@ -1,12 +1,8 @@
 import base64
 import os
 import unittest
-import pathlib
-import sys
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import _path  # noqa: F401  (must precede app imports)
 
 from fastapi.testclient import TestClient
 
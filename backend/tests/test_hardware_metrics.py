@@ -1,10 +1,6 @@
-import pathlib
-import sys
 import unittest
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import _path  # noqa: F401  (must precede app imports)
 
 from app.hardware_metrics import calculate_hardware_metrics
 
@@ -1,15 +1,12 @@
-import pathlib
-import sys
 import unittest
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import _path  # noqa: F401  (must precede app imports)
 
 from app.qiskit_runner import run_circuit
+from helpers import ProbAssertMixin
 
 
-class TestMeasurement(unittest.TestCase):
+class TestMeasurement(ProbAssertMixin, unittest.TestCase):
     def test_z_basis_measurement_statevector(self):
         res = run_circuit(
             num_qubits=1,
@@ -17,12 +14,10 @@ class TestMeasurement(unittest.TestCase):
                 {"type": "measure", "qubit": 0, "position": 0, "params": {"basis": "z"}},
             ],
             method="statevector",
-            shots=512,
+            shots=1,
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("0", 0.0), 1.0, places=8)
-        self.assertLess(probs.get("1", 0.0), 1e-8)
+        self.assertProbs(res["probabilities"], {"0": 1.0, "1": 0.0})
 
     def test_x_basis_measurement_statevector(self):
         res = run_circuit(
@@ -32,12 +27,10 @@ class TestMeasurement(unittest.TestCase):
                 {"type": "measure", "qubit": 0, "position": 1, "params": {"basis": "x"}},
             ],
             method="statevector",
-            shots=1000,
+            shots=1,
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("0", 0.0), 1.0, places=8)
-        self.assertLess(probs.get("1", 0.0), 1e-8)
+        self.assertProbs(res["probabilities"], {"0": 1.0, "1": 0.0})
 
         basis = res.get("measurement_basis") or {}
         self.assertEqual(basis.get(0), "x")
@@ -51,12 +44,10 @@ class TestMeasurement(unittest.TestCase):
                 {"type": "measure", "qubit": 0, "position": 2, "params": {"basis": "y"}},
             ],
             method="statevector",
-            shots=1000,
+            shots=1,
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("0", 0.0), 1.0, places=8)
-        self.assertLess(probs.get("1", 0.0), 1e-8)
+        self.assertProbs(res["probabilities"], {"0": 1.0, "1": 0.0})
 
         basis = res.get("measurement_basis") or {}
         self.assertEqual(basis.get(0), "y")
@@ -68,7 +59,7 @@ class TestMeasurement(unittest.TestCase):
                 {"type": "h", "qubit": 0, "position": 0},
             ],
             method="statevector",
-            shots=1000,
+            shots=1,
             measurement_config={
                 "basis": "z",
                 "qubits": [0],
@@ -77,9 +68,7 @@ class TestMeasurement(unittest.TestCase):
             },
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("00", 0.0), 0.5, places=6)
-        self.assertAlmostEqual(probs.get("01", 0.0), 0.5, places=6)
+        self.assertProbs(res["probabilities"], {"00": 0.5, "01": 0.5}, atol=5e-7)
 
     def test_mid_circuit_measurement_with_condition_statevector(self):
         res = run_circuit(
@@ -95,12 +84,10 @@ class TestMeasurement(unittest.TestCase):
                 },
             ],
             method="statevector",
-            shots=1000,
+            shots=1,
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("0", 0.0), 1.0, places=8)
-        self.assertLess(probs.get("1", 0.0), 1e-8)
+        self.assertProbs(res["probabilities"], {"0": 1.0, "1": 0.0})
 
     def test_metrics_included(self):
         res = run_circuit(
@@ -1,31 +1,37 @@
 import math
 import unittest
-import pathlib
-import sys
+from unittest import mock
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import _path  # noqa: F401  (must precede app imports)
 
-from app.qiskit_runner import run_circuit
+from app.qiskit_runner import (
+    _SUPPORTED_GATES,
+    _apply_gate,
+    _get_aer_backend,
+    _get_noisy_backend,
+    _load_aer_backend,
+    run_circuit,
+)
+from helpers import ProbAssertMixin
 
+# P(|1>) after RX(3 degrees) on |0>.
+_EXPECTED_P1_RX3DEG = math.sin(math.radians(3) / 2) ** 2
 
-class TestQiskitRunner(unittest.TestCase):
+
+class TestQiskitRunner(ProbAssertMixin, unittest.TestCase):
     def test_angle_small_integer_treated_as_degrees(self):
         res = run_circuit(
             num_qubits=1,
             gates=[{"type": "rx", "qubit": 0, "params": {"theta": 3}, "position": 0}],
             method="statevector",
-            shots=1000,
+            shots=1,
         )
 
         probs = res["probabilities"]
         self.assertIn("0", probs)
         self.assertIn("1", probs)
 
-        angle_rad = 3 * math.pi / 180.0
-        expected_p1 = math.sin(angle_rad / 2) ** 2
-        self.assertAlmostEqual(probs["1"], expected_p1, places=8)
+        self.assertAlmostEqual(probs["1"], _EXPECTED_P1_RX3DEG, places=8)
 
     def test_controlled_phase_via_p_with_controls(self):
         res = run_circuit(
@@ -40,11 +46,7 @@ class TestQiskitRunner(unittest.TestCase):
             shots=1000,
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("00", 0.0), 0.5, places=8)
-        self.assertAlmostEqual(probs.get("11", 0.0), 0.5, places=8)
-        self.assertLess(probs.get("01", 0.0), 1e-8)
-        self.assertLess(probs.get("10", 0.0), 1e-8)
+        self.assertProbs(res["probabilities"], {"00": 0.5, "11": 0.5, "01": 0.0, "10": 0.0})
 
         counts = res["counts"]
         self.assertEqual(sum(counts.values()), 1000)
@@ -58,12 +60,10 @@ class TestQiskitRunner(unittest.TestCase):
                 {"type": "swap", "qubit": 0, "targets": [1], "position": 1},
             ],
             method="statevector",
-            shots=512,
+            shots=1,
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("10", 0.0), 1.0, places=8)
-        self.assertLess(probs.get("01", 0.0), 1e-8)
+        self.assertProbs(res["probabilities"], {"10": 1.0, "01": 0.0})
 
     def test_toffoli_gate_statevector(self):
         res = run_circuit(
@@ -74,12 +74,10 @@ class TestQiskitRunner(unittest.TestCase):
                 {"type": "toffoli", "controls": [0, 1], "targets": [2], "position": 2},
             ],
             method="statevector",
-            shots=256,
+            shots=1,
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("111", 0.0), 1.0, places=8)
-        self.assertLess(probs.get("011", 0.0), 1e-8)
+        self.assertProbs(res["probabilities"], {"111": 1.0, "011": 0.0})
 
     def test_mid_circuit_measurement_with_reset(self):
         res = run_circuit(
@@ -95,12 +93,10 @@ class TestQiskitRunner(unittest.TestCase):
                 {"type": "x", "qubit": 0, "position": 2},
             ],
             method="statevector",
-            shots=512,
+            shots=1,
         )
 
-        probs = res["probabilities"]
-        self.assertAlmostEqual(probs.get("1", 0.0), 1.0, places=8)
-        self.assertLess(probs.get("0", 0.0), 1e-8)
+        self.assertProbs(res["probabilities"], {"1": 1.0, "0": 0.0})
 
     def test_qasm_execution_with_memory(self):
         res = run_circuit(
@@ -126,6 +122,17 @@ class TestQiskitRunner(unittest.TestCase):
         counts = res["counts"]
         self.assertEqual(sum(counts.values()), 64)
 
+    def test_simulator_backends_are_shared(self):
+        self.assertIs(_get_aer_backend("aer_simulator"), _get_aer_backend("aer_simulator"))
+        self.assertIs(_get_noisy_backend(), _get_noisy_backend())
+
+    def test_unknown_backend_names_do_not_grow_cache(self):
+        fallback = _get_aer_backend("qasm_simulator")
+        cached = _load_aer_backend.cache_info().currsize
+        self.assertIs(_get_aer_backend("unknown-backend-a"), fallback)
+        self.assertIs(_get_aer_backend("unknown-backend-b"), fallback)
+        self.assertEqual(_load_aer_backend.cache_info().currsize, cached)
+
     def test_cp_and_cz_gates_statevector(self):
         res = run_circuit(
             num_qubits=2,
@@ -135,7 +142,7 @@ class TestQiskitRunner(unittest.TestCase):
                 {"type": "cz", "qubit": 0, "targets": [1], "position": 2},
             ],
             method="statevector",
-            shots=128,
+            shots=1,
         )
         self.assertAlmostEqual(sum(res["probabilities"].values()), 1.0, places=8)
 
@@ -172,9 +179,9 @@ class TestQiskitRunner(unittest.TestCase):
                 {"type": "x", "qubit": 0, "position": 2, "params": {"condition": 1}},
             ],
             method="statevector",
-            shots=128,
+            shots=1,
         )
-        self.assertAlmostEqual(res["probabilities"].get("0", 0.0), 1.0, places=8)
+        self.assertProbs(res["probabilities"], {"0": 1.0})
 
     def test_measurement_with_targets_field(self):
         res = run_circuit(
@@ -184,9 +191,9 @@ class TestQiskitRunner(unittest.TestCase):
                 {"type": "measure", "targets": [0], "position": 1, "params": {"basis": "z", "cbit": 0}},
             ],
             method="statevector",
-            shots=128,
+            shots=1,
         )
-        self.assertAlmostEqual(res["probabilities"].get("1", 0.0), 1.0, places=8)
+        self.assertProbs(res["probabilities"], {"1": 1.0})
 
     def test_measurement_invalid_cbit_raises(self):
         with self.assertRaises(ValueError):
@@ -220,6 +227,32 @@ class TestQiskitRunner(unittest.TestCase):
                 shots=8,
             )
 
+    def test_invalid_gates_rejected_before_circuit_build(self):
+        with mock.patch("app.qiskit_runner._apply_gate") as apply_gate:
+            with self.assertRaises(ValueError):
+                run_circuit(
+                    num_qubits=1,
+                    gates=[
+                        {"type": "h", "qubit": 0, "position": 0},
+                        {"type": "measure", "qubit": 0, "position": 1, "params": {"cbit": 3}},
+                    ],
+                    method="qasm",
+                    shots=8,
+                )
+        apply_gate.assert_not_called()
+
+    def test_supported_gates_are_handled_by_apply_gate(self):
+        from qiskit import QuantumCircuit
+
+        for gtype in sorted(_SUPPORTED_GATES):
+            with self.subTest(gate=gtype):
+                gate = {"type": gtype, "qubit": 0, "targets": [1], "params": {}}
+                if gtype in {"toffoli", "ccx"}:
+                    gate = {"type": gtype, "controls": [0, 1], "targets": [2], "params": {}}
+                qc = QuantumCircuit(3, 3)
+                _apply_gate(qc, gate)
+                self.assertGreater(len(qc.data), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
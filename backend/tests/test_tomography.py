@@ -1,15 +1,15 @@
-import pathlib
-import sys
+import math
 import unittest
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import numpy as np
+
+import _path  # noqa: F401  (must precede app imports)
 
 from app.tomography import (
     measurement_tomography_single_qubit,
     process_tomography_single_qubit,
     state_fidelity,
+    state_fidelity_batch,
     state_tomography_single_qubit,
 )
 
@@ -33,6 +33,11 @@ class TestTomography(unittest.TestCase):
         self.assertAlmostEqual(bloch["x"], 0.0, places=6)
         self.assertAlmostEqual(bloch["y"], 0.0, places=6)
         self.assertAlmostEqual(bloch["z"], 1.0, places=6)
+        self.assertEqual(
+            result["density_matrix"],
+            [[[1.0, 0.0], [0.0, 0.0]], [[0.0, 0.0], [0.0, 0.0]]],
+        )
+        self.assertEqual(math.copysign(1.0, result["density_matrix"][0][1][1]), 1.0)
 
     def test_measurement_tomography_single_qubit(self):
         calibration = {
@@ -69,12 +74,121 @@ class TestTomography(unittest.TestCase):
         self.assertAlmostEqual(matrix[1][1], 1.0, places=6)
         self.assertAlmostEqual(matrix[2][2], 1.0, places=6)
 
+    def test_process_tomography_pauli_x_all_inputs(self):
+        process_measurements = {
+            "0": {"x": _counts(0.5), "y": _counts(0.5), "z": _counts(0.0)},
+            "1": {"x": _counts(0.5), "y": _counts(0.5), "z": _counts(1.0)},
+            "+": {"x": _counts(1.0), "y": _counts(0.5), "z": _counts(0.5)},
+            "-": {"x": _counts(0.0), "y": _counts(0.5), "z": _counts(0.5)},
+            "+i": {"x": _counts(0.5), "y": _counts(0.0), "z": _counts(0.5)},
+            "-i": {"x": _counts(0.5), "y": _counts(1.0), "z": _counts(0.5)},
+        }
+        result = process_tomography_single_qubit(process_measurements)
+        matrix = result["pauli_transfer_matrix"]
+        self.assertAlmostEqual(matrix[0][0], 1.0, places=6)
+        self.assertAlmostEqual(matrix[1][1], -1.0, places=6)
+        self.assertAlmostEqual(matrix[2][2], -1.0, places=6)
+        self.assertAlmostEqual(matrix[0][1], 0.0, places=6)
+
     def test_state_fidelity_identity(self):
         rho = [[1.0 + 0.0j, 0.0j], [0.0j, 0.0j]]
         sigma = [[1.0 + 0.0j, 0.0j], [0.0j, 0.0j]]
         fidelity = state_fidelity(rho, sigma)
         self.assertAlmostEqual(fidelity, 1.0, places=6)
 
+    def test_state_fidelity_mixed_state(self):
+        rho = [[0.5 + 0.0j, 0.0j], [0.0j, 0.5 + 0.0j]]
+        sigma = [[1.0 + 0.0j, 0.0j], [0.0j, 0.0j]]
+        fidelity = state_fidelity(rho, sigma)
+        self.assertAlmostEqual(fidelity, 0.5, places=6)
+
+    def test_state_fidelity_pure_states(self):
+        rho = [[1.0 + 0.0j, 0.0j], [0.0j, 0.0j]]
+        sigma = [[0.5 + 0.0j, 0.5 + 0.0j], [0.5 + 0.0j, 0.5 + 0.0j]]
+        fidelity = state_fidelity(rho, sigma)
+        self.assertAlmostEqual(fidelity, 0.5, places=6)
+
+    def test_state_fidelity_mixed_states_2x2(self):
+        rho = [[0.5 + 0.0j, 0.0j], [0.0j, 0.5 + 0.0j]]
+        sigma = [[0.75 + 0.0j, 0.0j], [0.0j, 0.25 + 0.0j]]
+        expected = (math.sqrt(0.375) + math.sqrt(0.125)) ** 2
+        self.assertAlmostEqual(state_fidelity(rho, sigma), expected, places=9)
+
+    def test_state_fidelity_mixed_states_4x4(self):
+        # Rotate two diagonal states by the same real unitary (H x H); fidelity is
+        # basis-independent, so it stays (sum_i sqrt(p_i q_i))^2.
+        p = np.array([0.4, 0.3, 0.2, 0.1])
+        q = np.array([0.25, 0.25, 0.25, 0.25])
+        hadamard = np.array([[1.0, 1.0], [1.0, -1.0]]) / math.sqrt(2)
+        unitary = np.kron(hadamard, hadamard)
+        rho = unitary @ np.diag(p) @ unitary.T
+        sigma = unitary @ np.diag(q) @ unitary.T
+        expected = float(np.sum(np.sqrt(p * q)) ** 2)
+        self.assertAlmostEqual(state_fidelity(rho, sigma), expected, places=9)
+        self.assertAlmostEqual(state_fidelity(rho.tolist(), sigma.tolist()), expected, places=9)
+
+    def test_state_fidelity_non_physical_rho(self):
+        # Linear inversion from finite shots can give |r| > 1. Negative
+        # eigenvalues of rho are clipped, so r = (1, 1, 1) against I/2 keeps only
+        # the (1 + sqrt(3))/2 eigenvalue and gives (1 + sqrt(3))/4.
+        rho = 0.5 * np.array([[2.0, 1.0 - 1.0j], [1.0 + 1.0j, 0.0]])
+        sigma = np.eye(2) / 2
+        self.assertAlmostEqual(
+            state_fidelity(rho, sigma), (1.0 + math.sqrt(3.0)) / 4.0, places=9
+        )
+
+        estimate = state_tomography_single_qubit(
+            {
+                "x": {"0": 0, "1": 100},
+                "y": {"0": 12, "1": 88},
+                "z": {"0": 0, "1": 100},
+            }
+        )
+        reference = state_tomography_single_qubit(
+            {
+                "x": {"0": 67, "1": 33},
+                "y": {"0": 53, "1": 47},
+                "z": {"0": 65, "1": 35},
+            }
+        )
+        rho = np.array(estimate["density_matrix"]).view(complex)[..., 0]
+        sigma = np.array(reference["density_matrix"]).view(complex)[..., 0]
+        self.assertAlmostEqual(state_fidelity(rho, sigma), 0.373213999, places=6)
+
+    def test_state_fidelity_non_physical_sigma(self):
+        # A non-physical sigma makes sqrt(rho) sigma sqrt(rho) indefinite; its
+        # negative eigenvalue is clipped, as for rho.
+        def bloch_state(x, y, z):
+            return 0.5 * np.array([[1.0 + z, x - 1.0j * y], [x + 1.0j * y, 1.0 - z]])
+
+        physical = bloch_state(0.3, 0.1, 0.2)
+        non_physical = bloch_state(0.9, 0.9, 0.0)
+        self.assertAlmostEqual(
+            state_fidelity(physical, non_physical), 0.7259080201, places=6
+        )
+        self.assertAlmostEqual(
+            state_fidelity(non_physical, physical), 0.7289087476, places=6
+        )
+
+    def test_state_fidelity_batch_matches_single(self):
+        zero = [[1.0 + 0.0j, 0.0j], [0.0j, 0.0j]]
+        mixed = [[0.5 + 0.0j, 0.0j], [0.0j, 0.5 + 0.0j]]
+        plus = [[0.5 + 0.0j, 0.5 + 0.0j], [0.5 + 0.0j, 0.5 + 0.0j]]
+        rhos = [zero, mixed, plus]
+        fidelities = state_fidelity_batch(rhos, zero)
+        self.assertEqual(len(fidelities), 3)
+        for rho, fidelity in zip(rhos, fidelities):
+            self.assertAlmostEqual(fidelity, state_fidelity(rho, zero), places=6)
+
+        # Non-physical (|r| > 1) estimates take the clipped eigh path in both.
+        weak = [[0.6 + 0.0j, 0.15 - 0.05j], [0.15 + 0.05j, 0.4 + 0.0j]]
+        non_physical = [[0.5 + 0.0j, 0.45 - 0.45j], [0.45 + 0.45j, 0.5 + 0.0j]]
+        rhos = [weak, non_physical, mixed]
+        sigmas = [non_physical, weak, non_physical]
+        fidelities = state_fidelity_batch(rhos, sigmas)
+        for rho, sigma, fidelity in zip(rhos, sigmas, fidelities):
+            self.assertAlmostEqual(fidelity, state_fidelity(rho, sigma), places=9)
+
 
 if __name__ == "__main__":
     unittest.main()